@@ -112,10 +112,10 @@ def main():
     # Ask the user if they would like to clean the data before saving it
     cleaned = taf.prompt_yes_no("Would you like to clean the data before saving to a csv file? (Yes/No): ")
     if cleaned:
-        cleaned_data = taf.clean_data(data, trade_type)
-        taf.save_data(cleaned_data, trade_type, save_dir, commodity, cleaned=True)
+        cleaned_data, raw_data = taf.clean_data(data, trade_type)
+        taf.save_data(cleaned_data, raw_data, trade_type, save_dir, commodity, cleaned=True)
     else:
         print("Data will be saved as is.")
-        taf.save_data(data, trade_type, save_dir, commodity, cleaned=False)
+        taf.save_data(data, None, trade_type, save_dir, commodity, cleaned=False)
 
 main()
\ No newline at end of file
@@ -8,13 +8,115 @@ import sys
 import os
 import requests as req
 import re
+import json
+import hashlib
+import threading
 import pyxlsb
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from email.utils import formatdate
+from functools import lru_cache
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard library JSON parser
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; fall back to Python string columns and pandas' CSV writer
+    pa = None
+
+# Keep object dtypes when replacing placeholder values with NaN (see clean_data())
+pd.set_option('future.no_silent_downcasting', True)
+
+# SHARED HTTP SESSION
+# ==================================================================
+# Number of API requests kept in flight at the same time
+MAX_WORKERS = 8
+
+def _build_session():
+    """
+    Build the pooled HTTP session used for every outbound request in the program
+    (Census API calls and the commodity wizard download), so that TCP/TLS
+    connections are kept alive between requests. Transient server errors and
+    rate limiting (429) are retried with an exponential backoff.
+    """
+    session = req.Session()
+    # One pool per host (api.census.gov and usitc.gov), each holding one kept-alive connection per worker
+    session.mount('https://', HTTPAdapter(pool_connections=2, pool_maxsize=MAX_WORKERS,
+                                          max_retries=Retry(total=5, backoff_factor=0.5,
+                                                            status_forcelist=[429, 500, 502, 503, 504],
+                                                            raise_on_status=False)))
+    return session
+
+SESSION = _build_session()
+
+# Number of country, district or port codes combined into a single API request
+CODE_CHUNK_SIZE = 20
+
+# Local cache of API responses, so repeated queries do not call the API again
+CACHE_DIR = '../resources/.census_cache'
+CACHE_EXPIRY = timedelta(days=7)
+
+# Text dtype for the HS code tables: a single contiguous Arrow string buffer per column when
+# pyarrow is installed, otherwise Python string objects. Codes are never parsed as numbers so
+# leading zeros are preserved. The fallback is object rather than str so blank cells stay missing
+# instead of becoming the text 'nan'.
+_CODES_DTYPE = pd.ArrowDtype(pa.string()) if pa else object
 
 # CUSTOM FUNCTIONS
 # ==================================================================
 # Custom Functions: update_commodity_wizard()
 # ==================================================================
+_CONCORDANCE_SHEETS = [('Import Concordance', 'import_codes.csv'),
+                       ('Export Concordance', 'export_codes.csv')]
+# The only concordance columns used by the commodity search
+_CODES_COLUMNS = ['hts10', 'description_long']
+
+def _read_and_save_sheet(xls, sheet_name, output_filename):
+    """Read one concordance sheet of the open commodity wizard workbook and save it to a CSV file."""
+    # Read the Excel file with specific dtype for codes as strings to preserve leading zeros
+    df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str, usecols=_CODES_COLUMNS).astype(_CODES_DTYPE)
+    # Save the DataFrame to a CSV file
+    df.to_csv(f'../resources/{output_filename}', index=False)
+    # Also save a Parquet copy, which loads much faster than the CSV on later searches
+    try:
+        df.to_parquet(_parquet_path(f'../resources/{output_filename}'), compression='snappy')
+    except ImportError:
+        pass  # pyarrow is optional; the CSV file is used instead
+    print(f"{sheet_name} has been saved to {output_filename}")
+
+
+def _parquet_path(file_name):
+    """Return the path of the Parquet copy of a CSV codes file."""
+    return os.path.splitext(file_name)[0] + '.parquet'
+
+
+def _load_codes(file_name):
+    """
+    Load an HS codes file, preferring its Parquet copy when one is available and up to date.
+
+    Parameters:
+    - file_name (str): The path to the import or export codes CSV file.
+
+    Returns:
+    - pd.DataFrame: The HS codes and their descriptions, read as strings.
+    """
+    parquet_file = _parquet_path(file_name)
+    if os.path.exists(parquet_file) and os.path.getmtime(parquet_file) >= os.path.getmtime(file_name):
+        try:
+            return pd.read_parquet(parquet_file, columns=_CODES_COLUMNS, dtype_backend='pyarrow')
+        except ImportError:
+            pass  # pyarrow is optional; fall back to the CSV file
+    # read the csv file as all strings to avoid mixed data types, parsing only the columns used by the search
+    return pd.read_csv(file_name, low_memory=False, dtype=_CODES_DTYPE, usecols=_CODES_COLUMNS)
+
+
 def update_commodity_wizard():
     """
     Checks the local commodity translation wizard file for updates 
@@ -28,6 +130,7 @@ def update_commodity_wizard():
     os.makedirs(os.path.dirname(codes_save_path), exist_ok=True)
 
     # Check if the file exists and the last update was more than a month ago
+    headers = {}
     if os.path.exists(codes_save_path):
         last_modified = datetime.fromtimestamp(os.path.getmtime(codes_save_path))
         if datetime.now() - last_modified < timedelta(days=30):
@@ -35,28 +138,38 @@ def update_commodity_wizard():
         else:
             print("It has been more than a month since the local HS Code files were updated. An update will be performed now.")
             print("Once the update is complete, the search will continue.")
+        # Only download the file again if it has changed since the last download
+        headers['If-Modified-Since'] = formatdate(os.path.getmtime(codes_save_path), usegmt=True)
 
-    # Download the file
+    # Download the file, streaming it to disk in chunks
     try:
-        response = req.get(dataweb_url, allow_redirects=True)
-        response.raise_for_status()  # Raise an exception for HTTP errors
-        with open(codes_save_path, 'wb') as file:
-            file.write(response.content)
-        print(f"File has been downloaded and saved to {codes_save_path}")
+        with SESSION.get(dataweb_url, headers=headers, stream=True, timeout=60) as response:
+            response.raise_for_status()  # Raise an exception for HTTP errors
+            if response.status_code == 304:
+                # The local file is still current, so restart the 30-day clock
+                os.utime(codes_save_path)
+                print("The local HS Code files are already up to date.")
+                if all(os.path.exists(f'../resources/{output_filename}') for _, output_filename in _CONCORDANCE_SHEETS):
+                    return
+            else:
+                temp_path = codes_save_path + '.part'
+                with open(temp_path, 'wb') as file:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        file.write(chunk)
+                os.replace(temp_path, codes_save_path)
+                print(f"File has been downloaded and saved to {codes_save_path}")
     except req.RequestException as e:
         print(f"An error occurred: {e}")
         return  # Exit if the download fails
 
-    # Extract and save sheets to CSV, ensuring leading zeros are preserved
+    # Extract and save sheets to CSV, ensuring leading zeros are preserved. The workbook is opened
+    # once so its shared string table is only parsed once for both sheets.
     try:
         with pd.ExcelFile(codes_save_path, engine='pyxlsb') as xls:
-            for sheet_name, output_filename in [('Import Concordance', 'import_codes.csv'),
-                                                ('Export Concordance', 'export_codes.csv')]:
-                # Read the Excel file with specific dtype for codes as strings to preserve leading zeros
-                df = pd.read_excel(xls, sheet_name=sheet_name, dtype=str)
-                # Save the DataFrame to a CSV file
-                df.to_csv(f'../resources/{output_filename}', index=False)
-                print(f"{sheet_name} has been saved to {output_filename}")
+            for sheet_name, output_filename in _CONCORDANCE_SHEETS:
+                _read_and_save_sheet(xls, sheet_name, output_filename)
+        # Drop any cached copies of the old code files
+        _codes_table.cache_clear()
     except Exception as e:
         print(f"An error occurred while processing the Excel file: {e}")
 
@@ -64,6 +177,9 @@ def update_commodity_wizard():
 # ==================================================================
 # Custom Functions: prompt_yes_no()
 # ==================================================================
+_YES = frozenset(('y', 'yes'))
+_NO = frozenset(('n', 'no'))
+
 def prompt_yes_no(message):
     """Prompt for a Yes/No response and return it.
     
@@ -74,9 +190,9 @@ def prompt_yes_no(message):
     - bool: True if the response is 'Yes', False if the response is 'No'.
     """
     response = input(message).strip().lower()
-    while response not in ["y", "yes", "n", "no"]:
+    while response not in _YES and response not in _NO:
         response = input("Invalid response. Please enter 'Yes' or 'No': ").strip().lower()
-    return response.startswith('y')
+    return response in _YES
 
 
 # ==================================================================
@@ -110,7 +226,7 @@ def validate_api_key(key):
     Returns:
     - bool: True if the key is valid, False otherwise.
     """
-    return len(key) == 40 or key == None
+    return key is None or len(key) == 40
 
 
 #==================================================================
@@ -205,6 +321,15 @@ def get_endpoint():
 # ==================================================================
 # Custom Function: determine_trade_type()
 # ==================================================================
+_TRADE_TYPES = {
+    ('imports', 'hs'): 'imp_hs',
+    ('imports', 'port'): 'imp_port',
+    ('imports', 'state'): 'imp_st',
+    ('exports', 'hs'): 'exp_hs',
+    ('exports', 'port'): 'exp_port',
+    ('exports', 'state'): 'exp_st',
+}
+
 def determine_trade_type(imp_exp, endpoint):
     """
     Determines the trade type based on the input parameters.
@@ -216,23 +341,25 @@ def determine_trade_type(imp_exp, endpoint):
     Returns:
     - str: The trade type based on the input parameters.
     """
-    if imp_exp == 'imports' and endpoint == 'hs':
-        return 'imp_hs'
-    elif imp_exp == 'imports' and endpoint == 'port':
-        return 'imp_port'
-    elif imp_exp == 'exports' and endpoint == 'hs':
-        return 'exp_hs'
-    elif imp_exp == 'exports' and endpoint == 'port':
-        return 'exp_port'
-    elif imp_exp == 'imports' and endpoint == 'state':
-        return 'imp_st'
-    else:
-        return 'exp_st'
+    # Default to exports data with state information if the combination is not listed
+    return _TRADE_TYPES.get((imp_exp, endpoint), 'exp_st')
     
     
-    # ==================================================================
+# ==================================================================
 # Custom Function: determine_base_url()
 # ==================================================================
+_BASE_URLS = {
+    # Imports and exports data with Harmonized System codes
+    ('imports', 'hs'): 'https://api.census.gov/data/timeseries/intltrade/imports/hs',
+    ('exports', 'hs'): 'https://api.census.gov/data/timeseries/intltrade/exports/hs',
+    # Imports and exports data with port information
+    ('imports', 'port'): 'https://api.census.gov/data/timeseries/intltrade/imports/porths',
+    ('exports', 'port'): 'https://api.census.gov/data/timeseries/intltrade/exports/porths',
+    # Imports and exports data with state information
+    ('imports', 'state'): 'https://api.census.gov/data/timeseries/intltrade/imports/statehs',
+    ('exports', 'state'): 'https://api.census.gov/data/timeseries/intltrade/exports/statehs',
+}
+
 def determine_base_url(imp_exp, endpoint):
     """
     Determines the base URL for the API request based on the trade type and endpoint.
@@ -244,29 +371,46 @@ def determine_base_url(imp_exp, endpoint):
     Returns:
     - str: The base URL for the API request.
     """ 
-    # Determine the base URL for imports data with Harmonized System codes
-    if imp_exp == 'imports' and endpoint == 'hs':
-        return 'https://api.census.gov/data/timeseries/intltrade/imports/hs'
-    # Determine the base URL for imports data with port information
-    elif imp_exp == 'imports' and endpoint == 'port':
-        return 'https://api.census.gov/data/timeseries/intltrade/imports/porths'
-    # Determine the base URL for exports data with Harmonized System codes
-    elif imp_exp == 'exports' and endpoint == 'hs':
-        return 'https://api.census.gov/data/timeseries/intltrade/exports/hs'
-    # Determine the base URL for exports data with port information
-    elif imp_exp == 'exports' and endpoint == 'port':
-        return 'https://api.census.gov/data/timeseries/intltrade/exports/porths' 
-    # Determine the base URL for imports data with state information
-    elif imp_exp == 'imports' and endpoint == 'state':
-        return 'https://api.census.gov/data/timeseries/intltrade/imports/statehs'
-    # Default to exports data with state information if none of the above conditions are met
-    else:
-        return 'https://api.census.gov/data/timeseries/intltrade/exports/statehs'
+    # Default to exports data with state information if the combination is not listed
+    return _BASE_URLS.get((imp_exp, endpoint), _BASE_URLS[('exports', 'state')])
     
 
 # ==================================================================
 # Custom Function: determine_base_params()
 # ==================================================================
+# Read-only parameter templates, built once at import; determine_base_params() hands out copies
+_BASE_PARAMS = MappingProxyType({
+    'imp_hs': MappingProxyType({
+        'get': 'I_COMMODITY,I_COMMODITY_LDESC,CTY_CODE,CTY_NAME,DISTRICT,DIST_NAME,UNIT_QY1,UNIT_QY2,GEN_VAL_YR,GEN_QY1_YR,GEN_QY1_YR_FLAG,GEN_QY2_YR,GEN_QY2_YR_FLAG,GEN_CHA_YR,GEN_CIF_YR,CC_YR,RP,CAL_DUT_YR,DUT_VAL_YR,CNT_CHA_YR,CNT_VAL_YR,CNT_WGT_YR,VES_WGT_YR,VES_VAL_YR,VES_CHA_YR,AIR_WGT_YR,AIR_VAL_YR,AIR_CHA_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+    'imp_port': MappingProxyType({
+        'get': 'I_COMMODITY,I_COMMODITY_LDESC,PORT,PORT_NAME,CTY_CODE,CTY_NAME,GEN_VAL_YR,CNT_VAL_YR,CNT_WGT_YR,VES_VAL_YR,VES_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+    'exp_hs': MappingProxyType({
+        'get': 'E_COMMODITY,E_COMMODITY_LDESC,DF,CTY_CODE,CTY_NAME,DISTRICT,DIST_NAME,UNIT_QY1,UNIT_QY2,ALL_VAL_YR,QTY_1_YR,QTY_1_YR_FLAG,QTY_2_YR,QTY_2_YR_FLAG,CNT_VAL_YR,CNT_WGT_YR,CC_YR,AIR_VAL_YR,AIR_WGT_YR,VES_VAL_YR,VES_WGT_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+    'exp_port': MappingProxyType({
+        'get': 'E_COMMODITY,E_COMMODITY_LDESC,PORT,PORT_NAME,CTY_CODE,CTY_NAME,ALL_VAL_YR,CNT_VAL_YR,CNT_WGT_YR,VES_VAL_YR,VES_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+    'imp_st': MappingProxyType({
+        'get': 'I_COMMODITY,I_COMMODITY_LDESC,STATE,CTY_NAME,CTY_CODE,GEN_VAL_YR,VES_VAL_YR,VES_WGT_YR,CNT_VAL_YR,CNT_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+    'exp_st': MappingProxyType({
+        'get': 'E_COMMODITY,E_COMMODITY_LDESC,STATE,CTY_NAME,CTY_CODE,ALL_VAL_YR,VES_VAL_YR,VES_WGT_YR,CNT_VAL_YR,CNT_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
+        'SUMMARY_LVL': 'DET',
+        }),
+})
+
+# The fields requested for each trade type, and those holding year-to-date values, quantities and weights
+_GET_FIELDS = MappingProxyType({trade_type: tuple(params['get'].split(',')) for trade_type, params in _BASE_PARAMS.items()})
+_NUMERIC_FIELDS = MappingProxyType({trade_type: tuple(field for field in fields if field.endswith('_YR'))
+                                   for trade_type, fields in _GET_FIELDS.items()})
+
 def determine_base_params(trade_type):
     """
     Determines the base parameters for the API request based on the trade type.
@@ -277,36 +421,69 @@ def determine_base_params(trade_type):
     Returns:
     - dict: A dictionary of base parameters for the API request.
     """
-    if trade_type == 'imp_hs':
-        return {
-            'get': 'I_COMMODITY,I_COMMODITY_LDESC,CTY_CODE,CTY_NAME,DISTRICT,DIST_NAME,UNIT_QY1,UNIT_QY2,GEN_VAL_YR,GEN_QY1_YR,GEN_QY1_YR_FLAG,GEN_QY2_YR,GEN_QY2_YR_FLAG,GEN_CHA_YR,GEN_CIF_YR,CC_YR,RP,CAL_DUT_YR,DUT_VAL_YR,CNT_CHA_YR,CNT_VAL_YR,CNT_WGT_YR,VES_WGT_YR,VES_VAL_YR,VES_CHA_YR,AIR_WGT_YR,AIR_VAL_YR,AIR_CHA_YR',
-            'SUMMARY_LVL': 'DET'
-            }
-    elif trade_type == 'imp_port':
-        return {
-            'get': 'I_COMMODITY,I_COMMODITY_LDESC,PORT,PORT_NAME,CTY_CODE,CTY_NAME,GEN_VAL_YR,CNT_VAL_YR,CNT_WGT_YR,VES_VAL_YR,VES_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
-            'SUMMARY_LVL': 'DET',
-            } 
-    elif trade_type == 'exp_hs':
-        return {
-            'get': 'E_COMMODITY,E_COMMODITY_LDESC,DF,CTY_CODE,CTY_NAME,DISTRICT,DIST_NAME,UNIT_QY1,UNIT_QY2,ALL_VAL_YR,QTY_1_YR,QTY_1_YR_FLAG,QTY_2_YR,QTY_2_YR_FLAG,CNT_VAL_YR,CNT_WGT_YR,CC_YR,AIR_VAL_YR,AIR_WGT_YR,VES_VAL_YR,VES_WGT_YR',
-            'SUMMARY_LVL': 'DET',
-            }
-    elif trade_type == 'exp_port':
-        return {
-            'get': 'E_COMMODITY,E_COMMODITY_LDESC,PORT,PORT_NAME,CTY_CODE,CTY_NAME,ALL_VAL_YR,CNT_VAL_YR,CNT_WGT_YR,VES_VAL_YR,VES_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
-            'SUMMARY_LVL': 'DET'
-            }
-    elif trade_type == 'imp_st':
-        return {
-            'get': 'I_COMMODITY,I_COMMODITY_LDESC,STATE,CTY_NAME,CTY_CODE,GEN_VAL_YR,VES_VAL_YR,VES_WGT_YR,CNT_VAL_YR,CNT_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
-            'SUMMARY_LVL': 'DET',
-        }
-    else:
-        return {
-            'get': 'E_COMMODITY,E_COMMODITY_LDESC,STATE,CTY_NAME,CTY_CODE,ALL_VAL_YR,VES_VAL_YR,VES_WGT_YR,CNT_VAL_YR,CNT_WGT_YR,AIR_VAL_YR,AIR_WGT_YR',
-            'SUMMARY_LVL': 'DET',
-        }
+    # Return a copy so the caller can add its own parameters (e.g. the API key)
+    return dict(_BASE_PARAMS.get(trade_type, _BASE_PARAMS['exp_st']))
+
+
+# ==================================================================
+# Custom Functions: _country_df() and _district_port_df()
+# ==================================================================
+@lru_cache(maxsize=None)
+def _country_df():
+    """Load the local country code file once and keep it for the rest of the session."""
+    country_df = pd.read_csv('../resources/country.csv', dtype=str)
+    # Lowercase the names once so searches do not need to case-fold on every call
+    country_df['Name_lc'] = country_df['Name'].str.lower()
+    return country_df
+
+
+@lru_cache(maxsize=None)
+def _district_port_df():
+    """Load the local district and port code file once and keep it for the rest of the session."""
+    district_port_df = pd.read_csv('../resources/district_port.csv', dtype=str)
+    # Lowercase the names once so searches do not need to case-fold on every call
+    district_port_df['Name_lc'] = district_port_df['Name'].str.lower()
+    return district_port_df
+
+
+@lru_cache(maxsize=None)
+def _country_names():
+    """Lowercase country names as a NumPy string array for vectorized substring searches."""
+    return _country_df()['Name_lc'].fillna('').to_numpy(dtype=str)
+
+
+@lru_cache(maxsize=None)
+def _district_port_names():
+    """Lowercase district and port names as a NumPy string array for vectorized substring searches."""
+    return _district_port_df()['Name_lc'].fillna('').to_numpy(dtype=str)
+
+
+@lru_cache(maxsize=None)
+def _country_codes():
+    """Set of valid country codes for constant-time validation of user entries."""
+    return frozenset(_country_df()['Code'].dropna())
+
+
+@lru_cache(maxsize=None)
+def _district_codes():
+    """Set of valid district codes for constant-time validation of user entries."""
+    return frozenset(_district_port_df()['District'].dropna())
+
+
+@lru_cache(maxsize=None)
+def _port_codes():
+    """Set of valid port codes for constant-time validation of user entries."""
+    return frozenset(_district_port_df()['Port'].dropna())
+
+
+def _substring_mask(names_lc, term):
+    """Return a boolean mask of the entries of a lowercase NumPy string array that contain the lowercase term."""
+    return np.char.find(names_lc, term) >= 0
+
+
+def _name_matches(df, names_lc, name):
+    """Return the rows of a reference table whose lowercase name contains the search term."""
+    return df.iloc[_substring_mask(names_lc, name.lower()).nonzero()[0]]
 
 
 # ==================================================================
@@ -327,32 +504,33 @@ def get_country_code(country):
     
     try: 
         # load the csb file
-        country_df = pd.read_csv('../resources/country.csv', dtype=str)
+        country_df = _country_df()
         country_list = [ctry.strip() for ctry in country.split(',')]
         # Loop through the list of countries
         for country in country_list:
-            matches = country_df[country_df['Name'].str.contains(country, case=False, na=False)]
-            
-            if not matches.empty:
-                for _, row in matches.iterrows():
-                    print(row['Name'], row['Code'])
-                    country_code.append(row['Code'])
-            else:
+            matches = _name_matches(country_df, _country_names(), country)
+            # Ask for the name again until a match is found
+            while matches.empty:
                 print(f"No matches found for '{country}'")
-                country_code = get_country_code(country)
-                return country_code
-
-        
-        use = input("""If you would like to use all the codes listed above, press Enter. 
-                    Otherwise, enter each desired code separated by a comma. """)
-        if use != '':
-            country_code = use.split(',')
+                country = input("Please re-enter the name of the country: ").strip()
+                matches = _name_matches(country_df, _country_names(), country)
+
+            for _, row in matches.iterrows():
+                print(row['Name'], row['Code'])
+                country_code.append(row['Code'])
+
+        use_prompt = """If you would like to use all the codes listed above, press Enter. 
+                    Otherwise, enter each desired code separated by a comma. """
+        use = input(use_prompt)
+        # Ask for the codes again until every code entered is valid
+        while use != '':
             # remove any whitespace
-            country_code = [code.strip() for code in country_code]
-            for code in country_code:
-                if code not in country_df['Code'].values:
-                    print("One or more of the country codes entered is invalid. Please try again.")
-                    country_code = get_country_code(country)
+            selected_codes = [code.strip() for code in use.split(',')]
+            if all(code in _country_codes() for code in selected_codes):
+                country_code = selected_codes
+                break
+            print("One or more of the country codes entered is invalid. Please try again.")
+            use = input(use_prompt)
         
         print(f"Data for the following countries will be requested using the country codes: {country_code}")
 
@@ -379,34 +557,35 @@ def get_dist_code(district):
     district_code = []
     try: 
         # load the csb file
-        district_df = pd.read_csv('../resources/district_port.csv', dtype=str)
+        district_df = _district_port_df()
         district_list = [dist.strip() for dist in district.split(',')]
         # Loop through the list of districts and filter the dataframe for matches
         for district in district_list:
-            matches = district_df[district_df['Name'].str.contains(district, case=False, na=False)]
-            
-            if not matches.empty:
-                for _, row in matches.iterrows():
-                    print(row['Name'], row['District'])
-                    district_code.append(row['District']) 
-            else:
+            matches = _name_matches(district_df, _district_port_names(), district)
+            # Ask for the name again until a match is found
+            while matches.empty:
                 print(f"No matches found for '{district}'")
-                district_code = get_dist_code(district)
-                return district_code                            
-                
+                district = input("Please re-enter the name of the district: ").strip()
+                matches = _name_matches(district_df, _district_port_names(), district)
+
+            for _, row in matches.iterrows():
+                print(row['Name'], row['District'])
+                district_code.append(row['District']) 
         
-        use = input("""If you would like to use all the codes listed above, press Enter. 
-                    Otherwise, enter each desired code separated by a comma. """)
-        if use != '':
-            district_code = use.split(',')
+        use_prompt = """If you would like to use all the codes listed above, press Enter. 
+                    Otherwise, enter each desired code separated by a comma. """
+        use = input(use_prompt)
+        # Ask for the codes again until every code entered is valid
+        while use != '':
             # remove any whitespace
-            district_code = [code.strip() for code in district_code]
-            for code in district_code:
-                if code not in district_df['District'].values:
-                    print("One or more of the district codes entered is invalid. Please try again.")
-                    district_code = get_dist_code(district)
-                    
-        else:
+            selected_codes = [code.strip() for code in use.split(',')]
+            if all(code in _district_codes() for code in selected_codes):
+                district_code = selected_codes
+                break
+            print("One or more of the district codes entered is invalid. Please try again.")
+            use = input(use_prompt)
+
+        if use == '':
             # keep only the unique values
             district_code = list(set(district_code))
         
@@ -437,33 +616,35 @@ def get_port_code(port):
     
     try: 
         # load the csb file
-        port_df = pd.read_csv('../resources/district_port.csv', dtype=str)
+        port_df = _district_port_df()
         port_list = [prt.strip() for prt in port.split(',')]
         # Loop through the list of ports
         for port in port_list:
-            matches = port_df[port_df['Name'].str.contains(port, case=False, na=False)]
-            
-            if not matches.empty:
-                for _, row in matches.iterrows():
-                    print(row['Name'], row['Port'])
-                    port_code.append(row['Port'])
-            else:
+            matches = _name_matches(port_df, _district_port_names(), port)
+            # Ask for the name again until a match is found
+            while matches.empty:
                 print(f"No matches found for '{port}'")
-                port_code = get_port_code(port)
-                return port_code
+                port = input("Please re-enter the name of the port: ").strip()
+                matches = _name_matches(port_df, _district_port_names(), port)
+
+            for _, row in matches.iterrows():
+                print(row['Name'], row['Port'])
+                port_code.append(row['Port'])
         
-        use = input("""If you would like to use all the codes listed above, press Enter. 
-                    Otherwise, enter each desired code separated by a comma. """)
-        if use != '':
-            port_code = use.split(',')
+        use_prompt = """If you would like to use all the codes listed above, press Enter. 
+                    Otherwise, enter each desired code separated by a comma. """
+        use = input(use_prompt)
+        # Ask for the codes again until every code entered is valid
+        while use != '':
             # remove any whitespace
-            port_code = [code.strip() for code in port_code]
-            for code in port_code:
-                if code not in port_df['Port'].values:
-                    print("One or more of the district codes entered is invalid. Please try again.")
-                    port_code = get_port_code(port)
-                    
-        else:
+            selected_codes = [code.strip() for code in use.split(',')]
+            if all(code in _port_codes() for code in selected_codes):
+                port_code = selected_codes
+                break
+            print("One or more of the port codes entered is invalid. Please try again.")
+            use = input(use_prompt)
+
+        if use == '':
             # keep only the unique values
             port_code = list(set(port_code))
         
@@ -479,18 +660,16 @@ def get_port_code(port):
 # ==================================================================
 # Custom Function: validate_code_format()
 # ==================================================================
+_HS_RE = re.compile(r'^(\d{2}|\d{4}|\d{6})\*?$|^\d{10}$')
+_PORT_RE = re.compile(r'^(\d{2}|\d{4})\*?$|^\d{6}$')
+
 def validate_code_format(code_list, endpoint):
     """Validate the format of each HS code in the list, 
     allowing wildcard '*' after 2, 4, or 6 digit codes."""
     
-    hs_pattern = re.compile(r'^(\d{2}|\d{4}|\d{6})\*?$|\d{10}$')
-    port_pattern = re.compile(r'^(\d{2}|\d{4})\*?$|\d{6}')
-    
     # validate the code format based on the endpoint
-    if endpoint == 'hs':
-        return all(hs_pattern.match(code) for code in code_list)
-    else:
-        return all(port_pattern.match(code) for code in code_list) 
+    pattern = _HS_RE if endpoint == 'hs' else _PORT_RE
+    return all(map(pattern.match, code_list))
 
 #==================================================================
 # Custom Function: commodity_selection_codes()
@@ -534,6 +713,16 @@ def commodity_selection_codes(commodity, endpoint, trade_type, imp_exp):
     return code_list
 
 
+# ==================================================================
+# Custom Function: _parse_code_list()
+# ==================================================================
+def _parse_code_list(text):
+    """Split a comma-separated list of codes, stripping whitespace and dropping blank and repeated codes."""
+    codes = (code.strip() for code in text.split(','))
+    # dict.fromkeys keeps the first occurrence of each code in the order entered
+    return list(dict.fromkeys(code for code in codes if code))
+
+
 # ==================================================================
 # Custom Function: HS_codes_input()
 # ==================================================================
@@ -557,39 +746,40 @@ def HS_codes_input(endpoint):
     print('''You may use the wild card character '*' to search for all codes that start with the characters you enter.
 For example, '85*' will return all HS codes that start with '85'.''', '\n')
     # Ask the user for the HS codes
-    code_list = input("Please enter the HS codes for the commodity you are interested in, separated by commas: ").split(",")  
+    code_list = _parse_code_list(input("Please enter the HS codes for the commodity you are interested in, separated by commas: "))
         
-    while not validate_code_format(code_list, endpoint):
+    while not code_list or not validate_code_format(code_list, endpoint):
         print("""Error: One or more HS codes are in an incorrect format. You may enter 2, 4, 6 or 10-digit codes if you are pulling data by HS code. 
     If you are pulling data by Port you may enter 4 or 6 digit codes:. Please ensure all codes are in the correct format.""")
-        code_list = input("Please enter the HS codes you want data for separated by commas. or type q to exit the program:  ").split(",")  
+        code_list = _parse_code_list(input("Please enter the HS codes you want data for separated by commas. or type q to exit the program:  "))
         
-        if code_list == 'q':
+        if code_list == ['q']:
             print("Thank you for using the US Census International Trade API program. Goodbye!")
             sys.exit()
             
     return code_list
-    
+
 
 # ==================================================================
 # Custom Function: validate_state()
 # ==================================================================
+@lru_cache(maxsize=None)
+def _states():
+    """Load the local state file once as a dict of uppercase abbreviations to full state names."""
+    state_df = pd.read_csv('../resources/states.csv')
+    return dict(zip(state_df['Abbreviation'].str.upper(), state_df['State']))
+
+
 def validate_state(st):
     """
     Validate the input state abbreviation and return the full state name if valid.
     """
     try:
-        # Load the CSV file
-        state_df = pd.read_csv('../resources/states.csv')
-        # Convert the input state abbreviation to uppercase to match the DataFrame's abbreviations
-        st = st.upper()
-
-        # Ensure DataFrame 'Abbreviation' column is in uppercase for case-insensitive comparison
-        if st not in state_df['Abbreviation'].str.upper().values:
+        # Convert the input state abbreviation to uppercase to match the abbreviations
+        state = _states().get(st.upper())
+        if state is None:
             print('Invalid state')
         else:
-            # Fetch the full state name corresponding to the abbreviation
-            state = state_df[state_df['Abbreviation'].str.upper() == st]['State'].values[0]
             print(f"Data for {state} will be requested")
 
     except Exception as e:
@@ -609,6 +799,32 @@ def valid_hs_lvl(endpoint):
         return ['','2','4','6'] 
 
 
+# ==================================================================
+# Custom Functions: _codes_table() and _search_descriptions()
+# ==================================================================
+# Only the import and export codes files are ever loaded, so two cache entries are enough
+@lru_cache(maxsize=2)
+def _codes_table(file_name):
+    """
+    Load an HS code file once per session.
+    The cached DataFrame is shared between searches and must not be modified in place.
+    """
+    return _load_codes(file_name)
+
+
+def _search_descriptions(file_name, commodity):
+    """
+    Return the rows of an HS code file whose description contains the commodity (case-insensitive).
+
+    The program searches once per run, so a single vectorized pass over the descriptions is
+    cheaper than building an index that would only be used once.
+    """
+    df = _codes_table(file_name)
+    matches = df['description_long'].str.contains(commodity, case=False, regex=False, na=False)
+    # Boolean indexing returns a copy, so callers may modify the result without touching the cache
+    return df[matches.to_numpy(dtype=bool)]
+
+
 # ==================================================================
 # Custom Function: commodity_codes_search()
 # ==================================================================
@@ -640,15 +856,15 @@ def commodity_codes_search(commodity, imp_exp, endpoint, hslvl=10):
     update_commodity_wizard()
     
     try:
-        # read the csv file as all strings to avoid mixed data types
-        df = pd.read_csv(file_name, low_memory=False, dtype=str)
-        matching_rows = df[df['description_long'].str.contains(commodity, case=False, na=False)]
+        matching_rows = _search_descriptions(file_name, commodity)
         unique_rows = matching_rows[['hts10', 'description_long']].drop_duplicates()
                            
         # Convert 'hts10' column to string to ensure .str operations work
         hslvl = int(hslvl)
         unique_rows['hts10'] = unique_rows['hts10'].astype(str) 
-        unique_rows['hts10'] = unique_rows['hts10'].str[:hslvl] 
+        # Codes are already 10 digits long, so only shorten them for a lower HS level
+        if hslvl < 10:
+            unique_rows['hts10'] = unique_rows['hts10'].str[:hslvl] 
         unique_rows = unique_rows.drop_duplicates(subset='hts10') 
          
         # Ask if user wants to use wildcard, if hslvl is not 10
@@ -658,9 +874,11 @@ def commodity_codes_search(commodity, imp_exp, endpoint, hslvl=10):
                 unique_rows['hts10'] = unique_rows['hts10'] + '*'
           
             
-        for index, row in unique_rows.iterrows():
-            code_list.append(row['hts10'])
-            print(f"{row['hts10']}\t{row['description_long']}")
+        # Pull both columns out once and print the matches in a single call
+        code_list = unique_rows['hts10'].tolist()
+        descriptions = unique_rows['description_long'].tolist()
+        if code_list:
+            print('\n'.join(f"{code}\t{description}" for code, description in zip(code_list, descriptions)))
     except FileNotFoundError:
         print(f"Error: The file {file_name} was not found.")
     except Exception as e:
@@ -748,6 +966,130 @@ def valid_year_input(prompt_message):
     return year
 
 
+# ==================================================================
+# Custom Function: _decode_response()
+# ==================================================================
+def _decode_response(content):
+    """
+    Decode the body of a Census API response, raising ValueError unless it is a JSON list of rows.
+    The API can answer with status 200 and an HTML page, for example when the API key is invalid.
+    """
+    payload = orjson.loads(content) if orjson else json.loads(content)
+    if not isinstance(payload, list) or not payload:
+        raise ValueError("the response is not a list of rows")
+    return payload
+
+
+# ==================================================================
+# Custom Function: _response_to_df()
+# ==================================================================
+def _response_to_df(payload):
+    """Convert a decoded Census API response (a header row followed by data rows) into a DataFrame in a single pass."""
+    header, rows = payload[0], payload[1:]
+    return pd.DataFrame(rows, columns=_dedup_columns(header))
+
+
+def _dedup_columns(header):
+    """
+    Rename repeated column names the way pandas does when reading a CSV file ('CTY_CODE', 'CTY_CODE.1', ...).
+    The API repeats a column when it is both requested and used as a predicate.
+    """
+    seen = {}
+    columns = []
+    for name in header:
+        if name in seen:
+            seen[name] += 1
+            columns.append(f'{name}.{seen[name]}')
+        else:
+            seen[name] = 0
+            columns.append(name)
+    return columns
+
+
+# ==================================================================
+# Custom Function: _prune_cache()
+# ==================================================================
+def _prune_cache():
+    """Create the response cache folder if needed and delete the entries older than CACHE_EXPIRY."""
+    cutoff = (datetime.now() - CACHE_EXPIRY).timestamp()
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with os.scandir(CACHE_DIR) as entries:
+            expired = [entry.path for entry in entries if entry.is_file() and entry.stat().st_mtime < cutoff]
+    except OSError:
+        return  # the cache is best-effort; requests are still sent without it
+    for path in expired:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+# ==================================================================
+# Custom Function: _cached_get()
+# ==================================================================
+def _cached_get(base_url, params):
+    """
+    Fetch one API request on the shared session, answering it from the local response cache
+    when a copy younger than CACHE_EXPIRY exists. Only successful responses that decode to a
+    list of rows are cached.
+
+    Parameters:
+    - base_url (str): The base URL for the API request.
+    - params (dict): The parameters for the API request.
+
+    Returns:
+    - tuple: The status code, the request URL and the decoded response (None unless the status is 200).
+
+    Raises:
+    - ValueError: If the API answers with status 200 but the body is not a list of rows.
+    """
+    # The API key does not change the data returned, so it is left out of the cache key
+    cache_params = sorted((name, value) for name, value in params.items() if name != 'key')
+    cache_key = hashlib.sha1((base_url + repr(cache_params)).encode()).hexdigest()
+    cache_path = f'{CACHE_DIR}/{cache_key}.json'
+
+    # The cache is best-effort: a missing, unreadable or unwritable cache file falls back to the API
+    try:
+        cached_at = datetime.fromtimestamp(os.path.getmtime(cache_path))
+        if datetime.now() - cached_at < CACHE_EXPIRY:
+            with open(cache_path, 'rb') as file:
+                content = file.read()
+            try:
+                return 200, None, _decode_response(content)
+            except ValueError:
+                # An unreadable cache entry is discarded and the request is sent again
+                os.remove(cache_path)
+    except OSError:
+        pass
+
+    response = SESSION.get(base_url, params=params, timeout=30)
+    if response.status_code != 200:
+        return response.status_code, response.url, None
+    try:
+        payload = _decode_response(response.content)
+    except ValueError as error:
+        raise ValueError(f"unreadable response from {response.url}: {error}") from None
+
+    # Write to a temporary file first so a concurrent reader never sees a partial file
+    temp_path = f'{cache_path}.{threading.get_ident()}.part'
+    try:
+        with open(temp_path, 'wb') as file:
+            file.write(response.content)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass  # e.g. a read-only resources folder or a full disk; the response is still returned
+    return response.status_code, response.url, payload
+
+
+# ==================================================================
+# Custom Function: _chunks()
+# ==================================================================
+def _chunks(codes, size):
+    """Split a list of codes into consecutive groups of at most `size` codes."""
+    return [codes[i:i + size] for i in range(0, len(codes), size)]
+
+
 # ==================================================================
 # Custom Function: make_call()
 # ==================================================================
@@ -768,7 +1110,6 @@ def make_call(base_url, parameters, start_year, end_year, imp_exp, code_list, ct
     - pandas.DataFrame: A DataFrame containing the compiled data.
     """
 
-    all_data = pd.DataFrame()
     data = None
     commodity_param = 'E_COMMODITY' if imp_exp == 'exports' else 'I_COMMODITY'
 
@@ -776,46 +1117,148 @@ def make_call(base_url, parameters, start_year, end_year, imp_exp, code_list, ct
     if code_list is None:
         code_list = [None]
 
-    for code in code_list:
-        if code is not None:
-            parameters[commodity_param] = code
-
-        years = range(start_year, end_year)
+    years = range(start_year, end_year)
 
-        # Create a list of parameter sets for each combination
-        parameter_sets = [(year, cty, dist, port, st) for year in years
-                        for cty in (cty_codes if cty_codes else [None])
-                        for dist in (dist_codes if dist_codes else [None])
-                        for port in (port_codes if port_codes else [None])
-                        for st in (state if state else [None])]
+    # Create a list of parameter sets for each combination. Country, district and port codes are
+    # sent in groups; the API returns the rows for every code in a group when the predicate is repeated.
+    parameter_sets = [(year, cty, dist, port, st) for year in years
+                    for cty in (_chunks(cty_codes, CODE_CHUNK_SIZE) if cty_codes else [None])
+                    for dist in (_chunks(dist_codes, CODE_CHUNK_SIZE) if dist_codes else [None])
+                    for port in (_chunks(port_codes, CODE_CHUNK_SIZE) if port_codes else [None])
+                    for st in (state if state else [None])]
 
+    # Build the full list of requests up front so they can be issued concurrently
+    tasks = []
+    for code in code_list:
         for year, cty, dist, port, st in parameter_sets:
             temp_params = parameters.copy()
+            if code is not None: temp_params[commodity_param] = code
             temp_params['time'] = year
             if cty: temp_params['CTY_CODE'] = cty
             if dist: temp_params['DISTRICT'] = dist
             if port: temp_params['PORT'] = port
             if st: temp_params['STATE'] = st
-
-            response = req.get(base_url, params=temp_params)
-
-            if response.status_code == 200:
-                response_data = response.json()
-                df = pd.DataFrame(response_data[1:], columns=response_data[0])
-                all_data = pd.concat([all_data, df], ignore_index=True)
-                all_data.to_csv('temp_data.csv', index=False)
-                data = pd.read_csv('temp_data.csv', low_memory=False, dtype=str)
-                os.remove('temp_data.csv')
+            tasks.append((code, temp_params))
+
+    def fetch(task):
+        # Return a failed request as an error so the responses already received are still kept
+        try:
+            return _cached_get(base_url, task[1]) + (None,)
+        except (req.RequestException, ValueError) as error:
+            return None, None, None, error
+
+    # Drop expired cache entries so the cache folder does not keep growing
+    _prune_cache()
+
+    # Issue the requests on the shared session, keeping several in flight at once
+    frames = []
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        responses = executor.map(fetch, tasks)
+        for (code, _), (status_code, url, payload, error) in zip(tasks, responses):
+            if error is not None:
+                print(f"Error: API request for HS code {code} failed: {error}")
+            elif status_code == 200:
+                frames.append(_response_to_df(payload))
             else:
-                print(f"Error: API request for HS code {code} failed with status code: {response.status_code}")
-                print(f"API request URL: {response.url}")
+                print(f"Error: API request for HS code {code} failed with status code: {status_code}")
+                print(f"API request URL: {url}")
+
+    # Combine all of the responses into a single DataFrame
+    if frames:
+        data = pd.concat(frames, ignore_index=True)
+        # Treat empty fields as missing values
+        data = data.where(data != '')
 
     return data
                 
 
+# ==================================================================
+# Custom Function: clean_numbers()
+# ==================================================================
+def clean_numbers(data, trade_type):
+    """
+    Convert the year-to-date value, quantity and weight columns to numbers, one column at a time.
+    Values that cannot be converted are set to missing.
+
+    Parameters:
+    - data (pd.DataFrame): The DataFrame to be converted.
+    - trade_type (str): Specifies the type of data, which determines the numeric columns.
+
+    Returns:
+    - pd.DataFrame: The DataFrame with numeric columns.
+    """
+    numeric_cols = [col for col in _NUMERIC_FIELDS[trade_type] if col in data.columns]
+    data[numeric_cols] = data[numeric_cols].apply(pd.to_numeric, errors='coerce', dtype_backend='numpy_nullable')
+    return data
+
+
+# ==================================================================
+# Custom Function: clean_strings()
+# ==================================================================
+def clean_strings(data):
+    """
+    Strip leading and trailing whitespace from the text columns, one column at a time.
+
+    Parameters:
+    - data (pd.DataFrame): The DataFrame to be cleaned.
+
+    Returns:
+    - pd.DataFrame: The DataFrame with stripped text columns.
+    """
+    string_cols = data.select_dtypes(include=['object', 'string']).columns
+    data[string_cols] = data[string_cols].apply(lambda col: col.str.strip())
+    return data
+
+
+# ==================================================================
+# Custom Function: clean_categories()
+# ==================================================================
+_CATEGORY_COLS = ('CTY_CODE', 'DISTRICT', 'PORT', 'STATE', 'I_COMMODITY', 'E_COMMODITY',
+                  'CTY_NAME', 'DIST_NAME', 'PORT_NAME', 'I_COMMODITY_LDESC', 'E_COMMODITY_LDESC')
+
+def clean_categories(data):
+    """
+    Store the code, name and description columns, whose values repeat on every year and month row,
+    as categoricals so each distinct value is only held once and the de-duplication and sorting
+    steps compare integer codes instead of strings.
+
+    Parameters:
+    - data (pd.DataFrame): The DataFrame to be converted.
+
+    Returns:
+    - pd.DataFrame: The DataFrame with categorical code, name and description columns.
+    """
+    category_cols = [col for col in _CATEGORY_COLS if col in data.columns]
+    data[category_cols] = data[category_cols].astype('category')
+    return data
+
+
 # ==================================================================
 #Custom Function: clean_data()
 # ==================================================================
+# For each trade type: the columns that must not be missing, the columns identifying a duplicate
+# row (the last one is kept), and the columns to sort by
+_CLEAN_SPEC = {
+    'imp_hs': (['CTY_CODE', 'DISTRICT', 'RP'],
+               ['I_COMMODITY', 'CTY_CODE', 'DISTRICT', 'YEAR'],
+               ['YEAR', 'MONTH', 'I_COMMODITY', 'DIST_NAME', 'CTY_NAME']),
+    'imp_port': (['PORT', 'CTY_CODE'],
+                 ['I_COMMODITY', 'CTY_CODE', 'PORT', 'YEAR'],
+                 ['YEAR', 'MONTH', 'I_COMMODITY', 'PORT_NAME', 'CTY_NAME']),
+    'exp_hs': (['CTY_CODE', 'DISTRICT', 'DF'],
+               ['E_COMMODITY', 'CTY_CODE', 'DISTRICT', 'YEAR'],
+               ['YEAR', 'MONTH', 'E_COMMODITY', 'DIST_NAME', 'CTY_NAME']),
+    'exp_port': (['PORT', 'CTY_CODE'],
+                 ['E_COMMODITY', 'CTY_CODE', 'PORT', 'YEAR'],
+                 ['YEAR', 'MONTH', 'E_COMMODITY', 'PORT_NAME', 'CTY_NAME']),
+    'imp_st': (['CTY_CODE', 'STATE'],
+               ['I_COMMODITY', 'CTY_CODE', 'STATE', 'YEAR'],
+               ['YEAR', 'MONTH', 'I_COMMODITY', 'CTY_NAME']),
+    'exp_st': (['CTY_CODE', 'STATE'],
+               ['E_COMMODITY', 'CTY_CODE', 'STATE', 'YEAR'],
+               ['YEAR', 'MONTH', 'E_COMMODITY', 'CTY_NAME']),
+}
+
 def clean_data(data, trade_type):
     """
     Cleans the input DataFrame by performing operations specific to the type of data.
@@ -828,56 +1271,34 @@ def clean_data(data, trade_type):
     Returns:
     - pd.DataFrame: The cleaned DataFrame.
     """   
-    # First save the raw data to a new DataFrame
-    raw_data = data.copy()    
+    # First save the raw data to a new DataFrame, with the time column split into year and month
+    raw_data = data.copy()
+    raw_data['YEAR'] = raw_data['time'].str.slice(0, 4)
+    raw_data['MONTH'] = raw_data['time'].str.slice(5, 7)
+    raw_data = raw_data.drop(columns=['time'])
 
 
     # Drop columns that were only needed for the API call
     data = data.drop(columns=['I_COMMODITY.1', 'E_COMMODITY.1', 'CTY_CODE.1','DISTRICT.1', 'STATE.1', 'COMM_LVL', 'SUMMARY_LVL'], errors='ignore')
     data = data.drop_duplicates()
     data = data.loc[:, ~data.columns.duplicated()]
-    pd.set_option('future.no_silent_downcasting', True)
-    data = data.replace('-', np.nan)
-    data = data.replace('00', np.nan)
+    # Replace both placeholder values with NaN in a single pass
+    data = data.replace({'-': np.nan, '00': np.nan})
     data = data.dropna(axis=1, how='all')
     data = data.loc[:, (data != '0').any(axis=0)]
     data = data.drop_duplicates(subset=data.columns.difference(['time']))
-    data['YEAR'] = data['time'].apply(lambda x: x.split('-')[0])
-    data['MONTH'] = data['time'].apply(lambda x: x.split('-')[1])
+    data['YEAR'] = data['time'].str.slice(0, 4)
+    data['MONTH'] = data['time'].str.slice(5, 7)
     data = data.drop(columns=['time'], axis=1)
+    data = clean_strings(data)
+    data = clean_numbers(data, trade_type)
+    data = clean_categories(data)
     
     # Clean the data based on the trade type
-    if trade_type == 'imp_hs':
-        data = data.dropna(subset=['CTY_CODE', 'DISTRICT', 'RP',])
-        data = data.drop_duplicates(subset=['I_COMMODITY','CTY_CODE','DISTRICT','YEAR'], keep='last')
-        data = data.sort_values(by=['YEAR', 'MONTH', 'I_COMMODITY', 'DIST_NAME', 'CTY_NAME'])
-        
-    
-    elif trade_type == 'imp_port':
-        data = data.dropna(subset=['PORT', 'CTY_CODE'])
-        data.drop_duplicates(subset=['I_COMMODITY', 'CTY_CODE', 'PORT', 'YEAR'], keep='last', inplace=True)
-        data.sort_values(by=['YEAR', 'MONTH', 'I_COMMODITY', 'PORT_NAME', 'CTY_NAME'], inplace=True)
-        
-    
-    elif trade_type == 'exp_hs':
-        data = data.dropna(subset=['CTY_CODE', 'DISTRICT', 'DF'])
-        data = data.drop_duplicates(subset=['E_COMMODITY','CTY_CODE','DISTRICT','YEAR'], keep='last') 
-        data = data.sort_values(by=['YEAR', 'MONTH', 'E_COMMODITY', 'DIST_NAME', 'CTY_NAME'])
-        
-    elif trade_type == 'exp_port':
-        data = data.dropna(subset=['PORT', 'CTY_CODE'])
-        data = data.drop_duplicates(subset=['E_COMMODITY','CTY_CODE','PORT','YEAR'], keep='last')
-        data = data.sort_values(by=['YEAR', 'MONTH', 'E_COMMODITY', 'PORT_NAME', 'CTY_NAME'])
-        
-    elif trade_type == 'imp_st':
-        data = data.dropna(subset=['CTY_CODE', 'STATE'])
-        data = data.drop_duplicates(subset=['I_COMMODITY','CTY_CODE','STATE','YEAR'], keep='last')
-        data = data.sort_values(by=['YEAR', 'MONTH', 'I_COMMODITY', 'CTY_NAME'])
-        
-    else:
-        data = data.dropna(subset=['CTY_CODE', 'STATE'])
-        data = data.drop_duplicates(subset=['E_COMMODITY','CTY_CODE','STATE','YEAR'], keep='last')
-        data = data.sort_values(by=['YEAR', 'MONTH', 'E_COMMODITY', 'CTY_NAME'])
+    dropna_cols, dedup_cols, sort_cols = _CLEAN_SPEC.get(trade_type, _CLEAN_SPEC['exp_st'])
+    data = data.dropna(subset=dropna_cols)
+    data = data.drop_duplicates(subset=dedup_cols, keep='last')
+    data = data.sort_values(by=sort_cols)
     data = data.reset_index(drop=True)
 
     # Filter out duplicate rows if the wildcard '*' was used
@@ -885,8 +1306,8 @@ def clean_data(data, trade_type):
         comm_col = 'I_COMMODITY'
     else:
         comm_col = 'E_COMMODITY'
-    longest_code = data[comm_col].str.len().max()
-    data = data[data[comm_col].str.len() == longest_code] 
+    code_lengths = data[comm_col].str.len()
+    data = data[code_lengths == code_lengths.max()]
     
     return data, raw_data
    
@@ -910,6 +1331,20 @@ def save_directory():
         return 'saved_data'
     
 
+# ==================================================================
+# Custom Function: _write_csv()
+# ==================================================================
+def _write_csv(df, path):
+    """Write a DataFrame to a CSV file with pyarrow's multithreaded writer when available, otherwise with pandas."""
+    if pa:
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), path)
+            return
+        except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+            pass  # a column pyarrow cannot convert; use pandas instead
+    df.to_csv(path, index=False)
+
+
 # ==================================================================
 # Custom Function: save_data()
 # ==================================================================
@@ -936,41 +1371,29 @@ def save_data(data,raw_data, trade_type, save_dir, commodity=None, cty_name=None
             descriptor += '_' + name
         else:
             descriptor += name
+
+    # create the save directory once, before writing any of the yearly files
+    os.makedirs(save_dir, exist_ok=True)
         
     if cleaned:
-        # Save the raw data first split the time column into year and month
-        raw_data['YEAR'] = data['time'].apply(lambda x: x.split('-')[0])
-        raw_data['MONTH'] = data['time'].apply(lambda x: x.split('-')[1])
-        # drop the time column
-        raw_data = data.drop(columns=['time'], axis=1)
-        
-        years = raw_data['YEAR'].unique()
-        for year in years:
-            data_year = raw_data[data['YEAR'] == year]
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-            data_year.to_csv(f'{save_dir}/{descriptor}_{trade_type}_{year}_raw.csv', index=False)
+        # Save the raw data first; clean_data() has already split its time column into year and month
+        # split the rows by year in a single pass
+        for year, data_year in raw_data.groupby('YEAR', sort=False):
+            _write_csv(data_year, f'{save_dir}/{descriptor}_{trade_type}_{year}_raw.csv')
                 
         # save the cleaned data to a csv file for each year
-        years = data['YEAR'].unique()
-        for year in years:
-            data_year = data[data['YEAR'] == year]
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-            data_year.to_csv(f'{save_dir}/{descriptor}_{trade_type}_{year}_cleaned.csv', index=False)
+        for year, data_year in data.groupby('YEAR', sort=False):
+            _write_csv(data_year, f'{save_dir}/{descriptor}_{trade_type}_{year}_cleaned.csv')
     else:
         # split the time column into year and month
-        data['YEAR'] = data['time'].apply(lambda x: x.split('-')[0])
-        data['MONTH'] = data['time'].apply(lambda x: x.split('-')[1])
+        data['YEAR'] = data['time'].str.slice(0, 4)
+        data['MONTH'] = data['time'].str.slice(5, 7)
         # drop the time column
         data = data.drop(columns=['time'], axis=1)
         
-        years = data['YEAR'].unique()
-        for year in years:
-            data_year = data[data['YEAR'] == year]
-            if not os.path.exists(save_dir):
-                os.makedirs(save_dir)
-            data_year.to_csv(f'{save_dir}/{descriptor}_{trade_type}_{year}_raw.csv', index=False)
+        # split the rows by year in a single pass
+        for year, data_year in data.groupby('YEAR', sort=False):
+            _write_csv(data_year, f'{save_dir}/{descriptor}_{trade_type}_{year}_raw.csv')
     
     print(f"Data saved to {save_dir}/{descriptor}_{trade_type}.csv")
     